@@ -13,9 +13,13 @@ CONFIG_REPO_PATH = os.path.join(PROJECT_HOME, "university_info_generator/configs
 CREDENTIAL_JSON_PATH = os.path.join(CONFIG_REPO_PATH, "uforseAdminKey.json")
 CACHE_REPO_PATH = os.path.join(PROJECT_HOME, "cache_repo")
 UNIVERSITY_ATTRIBUTE_CACHE_FILE_PATH = os.path.join(CACHE_REPO_PATH, "university_attribute_format.jsonl")
+UNIVERSITY_ATTRIBUTE_BINARY_CACHE_FILE_PATH = UNIVERSITY_ATTRIBUTE_CACHE_FILE_PATH + ".pkl"
 ENV_PATH = ".env"
 ENV_FILE_PATH = os.path.join(CONFIG_REPO_PATH, ENV_PATH)
 CACHE_MAX_SIZE = 128
+MAX_WORKERS = 8
+# seconds a sheet read such as the attribute format is reused before it is fetched again
+SHEET_CACHE_TTL = 600
 load_dotenv(ENV_FILE_PATH)
 OPENAI_API_KEY = os.getenv("UFORSE_OPENAI_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
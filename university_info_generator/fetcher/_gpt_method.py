@@ -13,6 +13,8 @@ Key Functions:
     returns it in JSON format.
 - get_value_and_reference_from_gpt: Retrieves specific attribute values and references for a given university
     using the OpenAI API.
+- get_fields_from_gpt: Retrieves several attribute values and references for a given university in a single
+    OpenAI API call.
 - fill_missing_entry: Updates missing entries in a worksheet based on the data fetched using OpenAI.
 - fill_target_university: A wrapper function to manage worksheet updates for university records.
 
@@ -37,7 +39,7 @@ function after setting up the appropriate API keys and sheet credentials.
 """
 
 import json
-from typing import List
+from typing import Dict, List, Tuple
 from dotenv import load_dotenv
 from openai import OpenAI
 from openai import APIConnectionError, APIError, RateLimitError
@@ -295,6 +297,108 @@ class GPTClient:
             print(ValueError("Failed to decode JSON from the response."))
             return "", []
 
+    @retry(
+        wait=wait_random_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(3),
+        retry=retry_if_exception_type(UnscorableCommentError)
+        | retry_if_exception_type(APIConnectionError)
+        | retry_if_exception_type(APIError)
+        | retry_if_exception_type(RateLimitError),
+        reraise=True,  # Reraise the last exception
+    )
+    def get_fields_from_gpt(
+        self,
+        university_name: str,
+        fields: Dict[str, Dict[str, str]],
+        reference: str,
+        model: str = "gpt-4-turbo",
+    ) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Retrieves several attributes of a university with a single OpenAI API call, instead of one call per attribute
+        as `get_value_and_reference_from_gpt` does. Every requested attribute is described in the prompt with its
+        expected format, an example and optional extra instructions, and the model is asked to answer all of them in
+        one JSON object.
+
+        Parameters:
+        - university_name (str): Name of the university.
+        - fields (Dict[str, Dict[str, str]]): Maps each target attribute to a dictionary with the keys "format",
+            "example" and "extra_prompt" describing how that attribute should be answered.
+        - reference (str): References or sources that might contain the required data.
+        - model (str): Specifies the OpenAI model to use, default is 'gpt-4-turbo'.
+
+        Returns:
+        - Dict[str, Tuple[str, List[str]]]: Maps each attribute the model answered to a tuple of the retrieved value
+            and the list of references it checked. Attributes missing from the answer are left out, and an empty
+            dictionary is returned when the response cannot be decoded.
+
+        Raises:
+        - OpenAIError: Handles various OpenAI specific exceptions like APIConnectionError, APIError, RateLimitError.
+        """
+        if not fields:
+            return {}
+        output_example = r"""{"description": {"output": "The University of British Columbia (UBC), located in British \
+            Columbia, Canada, is a public university.", \
+                "reference": ["https://en.wikipedia.org/wiki/University_of_British_Columbia"]}, \
+            "graduation_year": {"output": "4", "reference": ["https://you.ubc.ca/applying-ubc/requirements/"]}}"""
+        prompt = f"""
+        # Instruction
+        You are an Education developer in Canada aiming to help high school students to apply to universities. Now I will give
+        you any university_name, and a list of target_attributes for you to collect data from the internet, you are supposed to find the knowledge I am looking for and give me back an asserted output for every target_attribute.
+        If you have checked any websites during your data collection procedure, you should return a List[str], which is a list of references that you have checked.
+        If you don't know or you are not sure about a target_attribute, just return "not available" as its output without further explaining.
+        Think through the procedure deeply and take it step by step.
+        IMPORTANT: You don't need to explain your result, just produce the json as expected, following the exact format.
+
+        # Suggestion
+        When you have provided with an official website of the target university, you should value the official website heavily, and check it first.
+
+        # Extra Reference
+        {reference}
+        Those are a list of website that you may consider checking against during the data collection.
+
+        # Target Attributes
+        Each target_attribute is given with its expected output format, an example and extra instructions:
+        {json.dumps(fields, ensure_ascii=False)}
+
+        # Example
+        ## Input
+            university_name: University of British Columbia
+            target_attributes: ["description", "graduation_year"]
+
+        ## Output
+            {output_example}
+
+        # Output Format
+        When you are using a quotation, always use double quotation, and NEVER use single quotation.
+        Your result should always be directly parsable by json.loads
+        json string format, a json object keyed by every target_attribute, where each value has the format of
+        output: the expected format of that target_attribute,
+        reference: List[str], which is a list of references that you have checked.
+        """
+
+        messages = [
+            {"role": "system", "content": prompt},
+            {
+                "role": "user",
+                "content": f"university_name: {university_name}\ntarget_attributes: {list(fields)}",
+            },
+        ]
+        response = self.gpt_client.chat.completions.create(messages=messages, model=model)
+        result = response.choices[0].message.content
+        print(f"used GPT: get_fields_from_gpt, university_name: {university_name}, attributes: {list(fields)}")
+        try:
+            result_json = json.loads(result)
+        except (json.JSONDecodeError, TypeError):
+            print(ValueError("Failed to decode JSON from the response."))
+            return {}
+        if not isinstance(result_json, dict):
+            return {}
+        return {
+            attribute: (value.get("output", ""), value.get("reference", []))
+            for attribute, value in result_json.items()
+            if attribute in fields and isinstance(value, dict)
+        }
+
 
 __all__ = ["GPTClient"]
 # __all__ = ["get_university_name_from_gpt", "get_value_and_reference_from_gpt"]
@@ -10,6 +10,7 @@ Classes:
 Dependencies:
 - requests: Used to make HTTP requests.
 - BeautifulSoup: Used to parse HTML documents.
+- soupsieve: Used to compile the CSS selectors applied to the parsed pages.
 - collections.defaultdict: Used to manage default values for dictionary keys during scraping.
 
 The TuitionCrawl class includes methods for obtaining the URL of a university's specific page based on
@@ -19,6 +20,8 @@ The TuitionCrawl class includes methods for obtaining the URL of a university's
 Usage:
 - Create an instance of the TuitionCrawl class.
 - Call the fetch_tuition method with the name of the university to retrieve tuition fee information.
+- Call the fetch_tuitions method with several university names to retrieve their tuition fee information
+    concurrently.
 
 Example:
 ```python
@@ -29,8 +32,13 @@ print(tuition_info)
 
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 class TuitionCrawl:
@@ -39,12 +47,22 @@ class TuitionCrawl:
 
     Attributes:
     - headers (dict): HTTP headers for the request containing user-agent information.
+    - timeout (int): Seconds to wait for the server before giving up on a request.
+    - index_url (str): The URL of the university index page.
+    - link_strainer (SoupStrainer): Restricts parsing of the university index page to its anchor tags.
+    - tuition_heading_selector (soupsieve.SoupSieve): Selects the "TUITION FEES" heading of a university's page.
 
     Methods:
     - __init__: Initializes a TuitionCrawl object.
+    - _get_content: Sends a request to a URL and returns the raw HTML content.
     - _get_soup: Sends a request to a URL and returns the parsed HTML content as a BeautifulSoup object.
     - fetch_university_url: Fetches the URL of a university's page based on its name.
+    - iter_university_urls: Fetches the URLs of several universities' pages with a single pass over the index page.
+    - parse_tuition_page: Parses tuition fee information out of the raw HTML of a university's page.
+    - _fetch_tuition_from_url: Fetches tuition fee information from a university's page.
     - fetch_tuition: Fetches tuition fee information for a given university.
+    - iter_tuitions: Fetches tuition fee information for several universities concurrently, in completion order.
+    - fetch_tuitions: Fetches tuition fee information for several universities concurrently.
 
     Example Usage:
     ```
@@ -59,29 +77,62 @@ class TuitionCrawl:
         "DNT": "1",  # Do Not Track
         "Upgrade-Insecure-Requests": "1",
     }
+    # seconds to wait for the server before giving up on a request
+    timeout = 10
+    index_url = "https://universitystudy.ca/canadian-universities/"
+    # the university index page is only searched for its links
+    link_strainer = SoupStrainer("a")
+    # compiled once, instead of walking every h2 of each tuition page
+    tuition_heading_selector = soupsieve.compile('h2:-soup-contains("TUITION FEES")')
 
     def __init__(self):
         """
-        Initializes a TuitionCrawl object.
+        Initializes a TuitionCrawl object with a requests session, so connections are pooled and kept alive across
+        requests, and an empty cache of the university index page.
         """
-        return
+        self.session = requests.Session()
+        # the session keeps requests' default Accept-Encoding, which asks for every compression it can decode
+        self.session.headers.update(self.__class__.headers)
+        # keep enough pooled connections for concurrent fetches, and retry transient failures with a backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # university name (lower case) -> URL of its page, filled by the first search of the index page
+        self._university_urls: Optional[Dict[str, str]] = None
 
-    def _get_soup(self, url):
+    def _get_content(self, url) -> bytes:
         """
-        Sends a request to the specified URL and returns the parsed HTML content as a BeautifulSoup object.
+        Sends a request to the specified URL and returns the raw HTML content.
 
         Parameters:
         - url (str): The URL to send the request to.
 
         Returns:
-        - BeautifulSoup: Parsed HTML content as a BeautifulSoup object.
+        - bytes: The raw body of the response.
         """
-        # Send a request to the main page with a user-agent header
-        response = requests.get(url, headers=self.__class__.headers)
+        # Send a request to the main page, the session carries the user-agent header
+        response = self.session.get(url, timeout=self.__class__.timeout)
         response.raise_for_status()  # Raises an HTTPError for bad responses
+        return response.content
+
+    def _get_soup(self, url, parse_only: SoupStrainer = None):
+        """
+        Sends a request to the specified URL and returns the parsed HTML content as a BeautifulSoup object.
+
+        Parameters:
+        - url (str): The URL to send the request to.
+        - parse_only (SoupStrainer, optional): Restricts parsing to the matching elements, skipping the tree
+            construction for everything else.
 
-        # Parse the HTML content of the page to a soup
-        return BeautifulSoup(response.text, "html.parser")
+        Returns:
+        - BeautifulSoup: Parsed HTML content as a BeautifulSoup object.
+        """
+        # Parse the raw bytes of the page to a soup, lxml decodes them itself without an intermediate str
+        return BeautifulSoup(self._get_content(url), "lxml", parse_only=parse_only)
 
     def fetch_university_url(self, university_name: str):
         """
@@ -93,23 +144,124 @@ class TuitionCrawl:
         Returns:
         - str: The URL of the university's page if found, otherwise a message indicating the university was not found.
         """
-        base_url = "https://universitystudy.ca/canadian-universities/"
+        # run the search to the end, so the whole index is cached for the next lookups
+        return dict(self.iter_university_urls([university_name]))[university_name]
+
+    def iter_university_urls(self, university_names: List[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Fetches the URLs of several universities' pages with a single pass over the university index page.
+
+        Each URL is yielded as soon as its link is found, so callers can start fetching the university page while
+        the rest of the index is still being searched. The links of the whole index are remembered once it has been
+        searched, so later lookups do not fetch the index page again.
+
+        Parameters:
+        - university_names (List[str]): The names of the universities to search for.
+
+        Yields:
+        - tuple: The university name and the URL of its page if found, otherwise a message indicating the
+            university was not found or the error that occurred.
+        """
+        for university_name, url_or_message, _ in self._iter_university_links(university_names):
+            yield university_name, url_or_message
+
+    def _iter_university_links(self, university_names: List[str]) -> Iterator[Tuple[str, str, bool]]:
+        """
+        Searches the university index page like `iter_university_urls`, also telling whether a link was found.
+
+        Parameters:
+        - university_names (List[str]): The names of the universities to search for.
+
+        Yields:
+        - tuple: The university name, the URL of its page or the message explaining why there is none, and whether
+            the second element is a URL.
+        """
+        if self._university_urls is not None:
+            for university_name in university_names:
+                url = self._university_urls.get(university_name.lower())
+                if url is None:
+                    yield university_name, "University not found on the page.", False
+                else:
+                    yield university_name, url, True
+            return
 
+        # names differing only by case, or given more than once, share a key but are each yielded
+        remaining = defaultdict(list)
+        for university_name in university_names:
+            remaining[university_name.lower()].append(university_name)
         try:
-            soup = self._get_soup(base_url)
+            soup = self._get_soup(self.__class__.index_url, parse_only=self.__class__.link_strainer)
+        except requests.RequestException as exc:
+            for university_name in university_names:
+                yield university_name, f"An error occurred: {str(exc)}", False
+            return
+
+        # assuming that each university is a link in the page, keep the first link of each name
+        university_urls = {}
+        for link in soup.find_all("a"):
+            link_name = link.text.strip().lower()
+            if link_name in university_urls or not link.has_attr("href"):
+                continue
+            university_urls[link_name] = link["href"]
+            for university_name in remaining.pop(link_name, ()):
+                yield university_name, link["href"], True
+        self._university_urls = university_urls
+
+        for names in remaining.values():
+            for university_name in names:
+                yield university_name, "University not found on the page.", False
+
+    @classmethod
+    def parse_tuition_page(cls, content: bytes) -> dict:
+        """
+        Parses tuition fee information out of the raw HTML of a university's page.
 
-            # Find all anchor tags, assuming that each university is a link in the page
-            links = soup.find_all("a")
+        It only depends on its argument, so pages fetched elsewhere can be parsed in bulk, e.g. by a process pool.
 
-            # Filter links that contain the name of the university
-            for link in links:
-                if link.text.strip().lower() == university_name.lower():
-                    # Return the full URL if the university name matches
-                    return link["href"]
+        Parameters:
+        - content (bytes): The raw HTML of the university's page.
 
-            return "University not found on the page."
+        Returns:
+        - dict: A dictionary containing tuition fee information for domestic and international students.
+                Keys: 'domestic_student_tuition', 'international_student_tuition'.
+        """
+        soup = BeautifulSoup(content, "lxml")
+
+        # first find h2 contains TUITION FEES
+        target_element = cls.tuition_heading_selector.select_one(soup)
+        undergraduate_fees = defaultdict(str)
+        if target_element:
+            # from the website, the target elements are just behind "TUITION FEES"
+            current_element = target_element.find_next()
+            while current_element and len(undergraduate_fees) < 2:
+                if "Undergraduate tuition fees" in current_element.text:
+                    fee_span = current_element.span
+                    if fee_span is not None:
+                        fee = fee_span.text
+                        if fee not in undergraduate_fees.values():
+                            undergraduate_fees["fee" + str(len(undergraduate_fees))] = fee
+                current_element = current_element.find_next()
+        return {
+            "domestic_student_tuition": undergraduate_fees["fee0"],
+            "international_student_tuition": undergraduate_fees["fee1"],
+        }
+
+    def _fetch_tuition_from_url(self, university_name: str, target_url: str):
+        """
+        Fetches tuition fee information from a university's page.
+
+        Parameters:
+        - university_name (str): The name of the university.
+        - target_url (str): The URL of the university's page.
+
+        Returns:
+        - dict: A dictionary containing tuition fee information for domestic and international students.
+                Keys: 'domestic_student_tuition', 'international_student_tuition'.
+        """
+        try:
+            return self.parse_tuition_page(self._get_content(target_url))
         except requests.RequestException as exc:
-            return f"An error occurred: {str(exc)}"
+            return f"An error occurred with {university_name}: {str(exc)}"
 
     def fetch_tuition(self, university_name: str):
         """
@@ -122,32 +274,54 @@ class TuitionCrawl:
         - dict: A dictionary containing tuition fee information for domestic and international students.
                 Keys: 'domestic_student_tuition', 'international_student_tuition'.
         """
-        try:
-            target_url = self.fetch_university_url(university_name)
-            soup = self._get_soup(target_url)
-
-            # first find h2 contains TUITION FEES
-            h2_lst = soup.find_all("h2")
-            target = list(filter(lambda item: "TUITION FEES" in item, h2_lst))
-            undergraduate_fees = defaultdict(str)
-            if target:
-                # from the website, the target elements are just behind "TUITION FEES"
-                target_element = target[0]
-                current_element = target_element.find_next()
-                while current_element and len(undergraduate_fees) < 2:
-                    if (
-                        "Undergraduate tuition fees" in current_element.text
-                        and current_element.span.text not in undergraduate_fees.values()
-                    ):
-                        undergraduate_fees["fee" + str(len(undergraduate_fees))] = current_element.span.text
-                    current_element = current_element.find_next()
-            soup = self._get_soup(target_url)
-            return {
-                "domestic_student_tuition": undergraduate_fees["fee0"],
-                "international_student_tuition": undergraduate_fees["fee1"],
-            }
+        # run the search to the end, so the whole index is cached for the next lookups
+        (_, url_or_message, found), *_ = self._iter_university_links([university_name])
+        return self._fetch_tuition_from_url(university_name, url_or_message) if found else url_or_message
 
-        except requests.RequestException as exc:
-            return f"An error occurred with {university_name}: {str(exc)}"
+    def iter_tuitions(
+        self, university_names: List[str], max_workers: int = 8
+    ) -> Iterator[Tuple[str, Union[dict, str]]]:
+        """
+        Fetches tuition fee information for several universities concurrently, yielding each result as soon as it
+        is ready.
+
+        The university index page is fetched once, and each university page is submitted to a thread pool as soon as
+        its link is found, so the network round-trips of different universities overlap with each other and with the
+        rest of the index search. Results come back in completion order so a slow page does not hold up the
+        processing of pages that already arrived. At most `max_workers` pages are in flight at a time. All requests
+        share the crawler's session and its pooled connections. Universities without a link on the index page are
+        yielded right away with the message explaining why, without taking a worker.
+
+        Parameters:
+        - university_names (List[str]): The names of the universities.
+        - max_workers (int): The maximum number of universities scraped at the same time.
+
+        Yields:
+        - tuple: The university name and the result of `fetch_tuition` for it.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for name, url_or_message, found in self._iter_university_links(university_names):
+                if found:
+                    futures[executor.submit(self._fetch_tuition_from_url, name, url_or_message)] = name
+                else:
+                    # nothing to fetch, the message saying why is the result
+                    yield name, url_or_message
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def fetch_tuitions(self, university_names: List[str], max_workers: int = 8) -> Dict[str, Union[dict, str]]:
+        """
+        Fetches tuition fee information for several universities concurrently, see `iter_tuitions`.
+
+        Parameters:
+        - university_names (List[str]): The names of the universities.
+        - max_workers (int): The maximum number of universities scraped at the same time.
+
+        Returns:
+        - dict: Maps each university name to the result of `fetch_tuition` for it.
+        """
+        results = dict(self.iter_tuitions(university_names, max_workers=max_workers))
+        return {name: results[name] for name in university_names}
 
 __all__ = []
@@ -8,18 +8,20 @@ from setuptools import setup, find_packages
 setup(
     name="university_info_generator",
     version="0.1.2",
-    packages=find_packages(),
+    packages=find_packages(exclude=("tests", "tests.*")),
     install_requires=[
         # list the package dependencies here
         "pandas",
         "numpy",
-        "gspread",
-        "oauth2client",
+        "gspread>=6,<7",
+        "google-auth",
         "openai",
         "python-dotenv",
-        "gspread_dataframe",
         "bs4",
+        "lxml",
+        "soupsieve",
         "tenacity",
+        "orjson",
         # env for langchain
         "langchain",
         "langchain-openai",
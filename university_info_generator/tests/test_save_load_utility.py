@@ -0,0 +1,89 @@
+"""
+university_info_generator/tests/test_save_load_utility.py
+
+"""
+
+import os
+import tempfile
+import unittest
+
+from university_info_generator.configs.enum_class import GPTMethodType, HandlerType
+from university_info_generator.utility.save_load_utility import (
+    gpt_cache_key_from_str,
+    load_cache,
+    load_gpt_cache,
+    store_cache,
+    store_gpt_cache,
+)
+
+
+class TestAttributeCacheRoundTrip(unittest.TestCase):
+    def test_handlers_are_stored_by_name(self):
+        attribute_cache = {
+            "tuition": {"handler": HandlerType.TUITION_CRAWL, "description": "tuition fees"},
+            "ranking": {"handler": HandlerType.GPT_GENERAL, "description": ""},
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "attribute.jsonl")
+            store_cache(cache_path, attribute_cache)
+            loaded = load_cache(cache_path)
+
+        self.assertEqual(loaded["tuition"], {"handler": "TUITION_CRAWL", "description": "tuition fees"})
+        self.assertEqual(
+            {name: HandlerType[row["handler"]] for name, row in loaded.items()},
+            {name: row["handler"] for name, row in attribute_cache.items()},
+        )
+
+
+class TestGPTCacheRoundTrip(unittest.TestCase):
+    gpt_cache = {
+        ("Example University", GPTMethodType.BASIC_INFO): ({"university_name": "Example University"}, []),
+        ("Example University", "ranking_us_news_2023", GPTMethodType.ATTRIBUTE_INFO): (35, ["https://example.edu"]),
+    }
+
+    def test_key_from_str(self):
+        self.assertEqual(
+            gpt_cache_key_from_str("('Example University', <GPTMethodType.BASIC_INFO: 1>)"),
+            ("Example University", GPTMethodType.BASIC_INFO),
+        )
+        self.assertEqual(
+            gpt_cache_key_from_str(
+                "(('Example University', 'ranking_us_news_2023'), <GPTMethodType.ATTRIBUTE_INFO: 2>)"
+            ),
+            ("Example University", "ranking_us_news_2023", GPTMethodType.ATTRIBUTE_INFO),
+        )
+
+    def test_store_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "gpt_cache.jsonl")
+            store_gpt_cache(cache_path, self.gpt_cache)
+            loaded = load_gpt_cache(cache_path)
+
+        self.assertEqual(loaded, self.gpt_cache)
+
+    def test_load_stringified_keys(self):
+        # caches written by store_cache before store_gpt_cache existed
+        legacy_cache = {
+            str(("Example University", GPTMethodType.BASIC_INFO)): ({"university_name": "Example University"}, []),
+            str((("Example University", "ranking_us_news_2023"), GPTMethodType.ATTRIBUTE_INFO)): (
+                35,
+                ["https://example.edu"],
+            ),
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "gpt_cache.jsonl")
+            store_cache(cache_path, legacy_cache)
+            loaded = load_gpt_cache(cache_path)
+
+        self.assertEqual(loaded, self.gpt_cache)
+
+    def test_load_cache_rejects_gpt_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "gpt_cache.jsonl")
+            store_gpt_cache(cache_path, self.gpt_cache)
+            with self.assertRaises(ValueError):
+                load_cache(cache_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+university_info_generator/tests/test_university_info_general_generator.py
+
+"""
+
+import os
+import unittest
+
+# the generator builds its OpenAI clients on construction, no request is sent by these tests
+os.environ.setdefault("UFORSE_OPENAI_API_KEY", "test-key")
+
+from university_info_generator.configs.enum_class import GPTMethodType, HandlerType
+from university_info_generator.university import University
+from university_info_generator.university_info_general_generator import UniversityInfoGenerator
+
+UNIVERSITY_NAME = "Example University"
+
+
+class TestGetUniversityInfo(unittest.TestCase):
+    def setUp(self):
+        basic_info = {
+            "university_name": UNIVERSITY_NAME,
+            "website": "https://www.example.edu",
+            "wikipedia": "https://en.wikipedia.org/wiki/Example_University",
+        }
+        self.generator = UniversityInfoGenerator(
+            target_universities={UNIVERSITY_NAME: basic_info},
+            attributes={"ranking_us_news_2023": {"handler": HandlerType.GPT_GENERAL}},
+            gpt_cache_list={(UNIVERSITY_NAME, "ranking_us_news_2023", GPTMethodType.ATTRIBUTE_INFO): (35, [])},
+        )
+
+    def tearDown(self):
+        self.generator.close()
+
+    def test_cached_numeric_attribute(self):
+        university = self.generator.get_university_info(UNIVERSITY_NAME)
+
+        self.assertIsInstance(university, University)
+        self.assertEqual(university.get_attr("ranking_us_news_2023"), 35)
+
+    def test_loaded_university_entry(self):
+        # load_from_file stores the dictionaries written by store_cache
+        self.generator.university_info_dict[UNIVERSITY_NAME] = {
+            "id_": "0",
+            "university_name": UNIVERSITY_NAME,
+            "ranking_us_news_2023": 35,
+        }
+        university = self.generator.get_university_info(UNIVERSITY_NAME)
+
+        self.assertIsInstance(university, University)
+        self.assertIs(self.generator.university_info_dict[UNIVERSITY_NAME], university)
+        self.assertEqual(university.get_attr("ranking_us_news_2023"), 35)
+
+
+if __name__ == "__main__":
+    unittest.main()
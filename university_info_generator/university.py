@@ -10,6 +10,8 @@ The `University` class is a core component, representing comprehensive details a
 
 Functions:
     - str_to_list: Converts a string to a list of strings based on a given splitter.
+    - University.from_dict: Class method that builds a `University` instance from a dictionary, supporting
+        translations between English and Simplified Chinese.
     - University.json_to_university: Static method that deserializes JSON input into a `University` instance, supporting
         translations between English and Simplified Chinese.
 
@@ -88,6 +90,7 @@ class University:
     Methods:
         __init__: Initializes the University object with the provided values for its attributes.
         __repr__: Provides a simple string representation of the university.
+        __setstate__: Restores a pickled university, including ones pickled before `__slots__` was added.
         to_dict_ch: Returns a dictionary representation of the university's attributes with keys in Chinese.
         to_dict_en: Returns a dictionary representation of the university's attributes with keys in English.
 
@@ -175,6 +178,9 @@ class University:
 
     valid_keys = set(en_ch_translation_map.keys())
 
+    # instances only ever hold these three fields, so they skip the per-instance __dict__
+    __slots__ = ("id_", "university_name", "params")
+
     # def __init__(self, **kwargs):
     #     for key, value in kwargs.items():
     #         setattr(self, key, value)
@@ -197,6 +203,14 @@ class University:
         self.university_name: str = university_name
         self.params: Dict[str, str] = params if params is not None else {}
 
+    def __setstate__(self, state):
+        """Restores a pickled University, including those pickled before it had __slots__."""
+        # slotted objects are pickled as (None, slot_state), older pickles as a plain __dict__
+        if isinstance(state, tuple):
+            state = state[1]
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def get_attr(self, attr_name: str, default=None):
         """
         Retrieves the value of the specified attribute or a default value if the attribute does not exist.
@@ -223,18 +237,22 @@ class University:
         """Translates dictionary keys from Chinese to English based on a provided translation map."""
         return {translation_map.get(key, key): value for key, value in source_dict.items()}
 
-    @staticmethod
-    def json_to_university(json_input, language="EN"):
-        """Deserialize JSON input into a dictionary using a translation map for keys."""
+    @classmethod
+    def from_dict(cls, data: Dict[str, str], language="EN"):
+        """Build a University from a dictionary using a translation map for keys."""
         if language not in (language_option := ("EN", "CH")):
             raise ValueError(f"University only supports two language: {language_option}, but got {language}")
-        data = json.loads(json_input)
         if language == "CH":
-            data = University.translate(data, University.ch_en_translation_map)
+            data = cls.translate(data, cls.ch_en_translation_map)
         filtered_data = {
-            key: data[key] for key in data if key in University.valid_keys and key not in ("id_", "university_name")
+            key: data[key] for key in data if key in cls.valid_keys and key not in ("id_", "university_name")
         }
-        return University(data["id_"], data["university_name"], filtered_data)
+        return cls(data["id_"], data["university_name"], filtered_data)
+
+    @classmethod
+    def json_to_university(cls, json_input, language="EN"):
+        """Deserialize JSON input into a dictionary using a translation map for keys."""
+        return cls.from_dict(json.loads(json_input), language=language)
 
 
 __all__ = ["University"]
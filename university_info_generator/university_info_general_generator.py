@@ -25,30 +25,66 @@ This module is prepared for a larger system aimed at providing educational resou
     data-driven methods.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 import json
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 import math
+import os
+import threading
 import gspread
 import numpy as np
+import pandas as pd
 
 from university_info_generator.university import University
 from university_info_generator.fetcher._gpt_method import GPTClient
 from university_info_generator.fetcher._tuition_crawl import TuitionCrawl
 from university_info_generator.fetcher._langchain_method import LanchainWrapper
 from university_info_generator.configs.enum_class import BasicInfoType, SavedDictType, GPTMethodType, HandlerType
-from university_info_generator.utility.save_load_utility import load_cache, store_cache
+from university_info_generator.utility.save_load_utility import (
+    load_cache,
+    store_cache,
+    load_gpt_cache,
+    store_gpt_cache,
+    load_cache_binary,
+    store_cache_binary,
+    gpt_cache_key_from_str,
+    BINARY_CACHE_SUFFIX,
+)
 from university_info_generator.configs import config
 
+# enum members and keys bound once at import time for the per-attribute hot path
+_HANDLER_COL = "handler"
+_H_TUITION = HandlerType.TUITION_CRAWL
+_H_LANGCHAIN = HandlerType.LANGCHAIN_TAVILY
+_UNI_NAME = BasicInfoType.UNIVERSITY_NAME.name.lower()
+# basic info attributes that are not fetched again once add_basic_university_info has filled them
+_SKIP_ATTRS = frozenset(("wikipedia", "website"))
+
 
 def _is_nan(value):
-    """Check if the given value is NaN."""
+    """Check if the given value is NaN, or None as NaN is stored as null in the JSON caches."""
+    # fast paths for the common cell types: strings are never NaN, and NaN is the only float unequal to itself
+    value_type = type(value)
+    if value_type is str:
+        return False
+    if value is None:
+        return True
+    if value_type is float:
+        return value != value
     try:
         return math.isnan(float(value))
     except (ValueError, TypeError):
         return False
 
 
+def _has_value(value) -> bool:
+    """Check if an attribute value holds an answer, cached GPT answers may be numbers or lists as well as strings."""
+    if value is None or value == "":
+        return False
+    return not isinstance(value, (str, list, dict)) or len(value) > 0
+
+
 class UniversityInfoGenerator:
     """
     A class responsible for generating and managing comprehensive information about universities.
@@ -65,8 +101,11 @@ class UniversityInfoGenerator:
             class, representing detailed information about each university.
         attribute_dict (Dict[str, Dict[str, Any]]): A dictionary that holds attributes and metadata for
             university attributes, such as data type and retrieval method.
-        gpt_cache_dict (Dict[str, Tuple[Any, List[str]]]): A cache that stores results from GPT-based queries
-            to prevent redundant API calls and speed up response times.
+        gpt_cache_dict (Dict[tuple, Tuple[Any, List[str]]]): A cache that stores results from GPT-based queries
+            to prevent redundant API calls and speed up response times. Keys are plain tuples such as
+            `(university_name, GPTMethodType.BASIC_INFO)` or
+            `(university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)`, and are only converted to a
+            serializable form when the cache is saved.
 
 
     Usage:
@@ -100,7 +139,11 @@ class UniversityInfoGenerator:
         if university_infos is None:
             university_infos = {}
         if attributes is None:
-            attributes = load_cache(config.UNIVERSITY_ATTRIBUTE_CACHE_FILE_PATH)
+            attributes = (
+                load_cache_binary(config.UNIVERSITY_ATTRIBUTE_BINARY_CACHE_FILE_PATH)
+                if os.path.exists(config.UNIVERSITY_ATTRIBUTE_BINARY_CACHE_FILE_PATH)
+                else load_cache(config.UNIVERSITY_ATTRIBUTE_CACHE_FILE_PATH)
+            )
         if gpt_cache_list is None:
             gpt_cache_list = {}
 
@@ -110,6 +153,9 @@ class UniversityInfoGenerator:
         self.gpt_cache_dict = gpt_cache_list
         self.tuition_crawl = TuitionCrawl()
         self.gpt_client = GPTClient()
+        self._basic_info_merge_cache: Dict[str, Tuple[Dict[str, str], str]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=config.MAX_WORKERS)
+        self._cache_lock = threading.Lock()
         # self.get_retrieved_attr = LanchainWrapper.get_retrieved_attr_with_format
 
     def fine_tuning(self):
@@ -164,16 +210,16 @@ class UniversityInfoGenerator:
             raise ValueError(f"Invalid type provided: {param_type}. Expected a BasicInfoType.")
         if param_type == BasicInfoType.UNIVERSITY_NAME and param in self.university_basic_info_dict:
             return self.university_basic_info_dict[param]
-        gpt_dict_key = str((param, GPTMethodType.BASIC_INFO))
+        gpt_dict_key = (param, GPTMethodType.BASIC_INFO)
         if gpt_dict_key in self.gpt_cache_dict:
             result, _ = self.gpt_cache_dict[gpt_dict_key]
             return result
         json_str = self.gpt_client.get_university_name_from_gpt(param)
         target_data = json.loads(json_str)
-        uni_name = target_data[BasicInfoType.UNIVERSITY_NAME.name.lower()]
-        self.gpt_cache_dict[str((uni_name, GPTMethodType.BASIC_INFO))] = (target_data, [])
+        uni_name = target_data[_UNI_NAME]
+        self.gpt_cache_dict[(uni_name, GPTMethodType.BASIC_INFO)] = (target_data, [])
         if param != uni_name:
-            self.gpt_cache_dict[str((param, GPTMethodType.BASIC_INFO))] = (target_data, [])
+            self.gpt_cache_dict[(param, GPTMethodType.BASIC_INFO)] = (target_data, [])
         self.university_basic_info_dict[uni_name] = target_data
         return target_data
 
@@ -185,7 +231,7 @@ class UniversityInfoGenerator:
         if len(self.attribute_dict) <= 0:
             raise Exception("Please load the attribute dictionary first.")
         if (
-            gpt_dict_key := str(((university_name, attribute_name), GPTMethodType.ATTRIBUTE_INFO))
+            gpt_dict_key := (university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)
         ) in self.gpt_cache_dict:
             return self.gpt_cache_dict[gpt_dict_key][0]
         if university_name in self.university_info_dict:
@@ -198,7 +244,7 @@ class UniversityInfoGenerator:
         """
         TODO: place holder for initializing university_json
         """
-        return {"id_": "0", "university_name": university_name}
+        return {"id_": "0", _UNI_NAME: university_name}
 
     def add_basic_university_info(self, university_json: Dict[str, str], university_name):
         """
@@ -222,6 +268,8 @@ class UniversityInfoGenerator:
             - Updates the passed university JSON dictionary with this basic information.
             - TODO: Initializes or updates the 'id_' key to '0' as a placeholder for a future unique identifier.
             - Constructs a reference string from the university's website and Wikipedia URL, if available.
+            - Memoizes the merged basic information and reference per university name, so repeated calls for the
+                same university skip the lookup entirely.
             - Returns the updated university JSON and the reference string.
 
         Usage:
@@ -238,11 +286,16 @@ class UniversityInfoGenerator:
             >>> print(references)
             'https://www.example.edu https://en.wikipedia.org/wiki/Example_University'
         """
+        if university_name in self._basic_info_merge_cache:
+            cached_json, reference = self._basic_info_merge_cache[university_name]
+            university_json.update(cached_json)
+            return university_json, reference
         basic_json = self.get_university_basic_info(param=university_name, param_type=BasicInfoType.UNIVERSITY_NAME)
-        university_json.update(basic_json)
         # TODO: add logic to produce id
-        university_json.update({"id_": "0"})
+        merged_json = dict(basic_json) | {"id_": "0"}
+        university_json.update(merged_json)
         reference = basic_json.get("website", "") + " " + basic_json.get("wikipedia", "")
+        self._basic_info_merge_cache[university_name] = (merged_json, reference)
         return university_json, reference
 
     def handle_tuition_info(self, university_json, university_name):
@@ -320,7 +373,7 @@ class UniversityInfoGenerator:
             where up-to-date and detailed information about university attributes is crucial, such as in educational
             resource platforms or university comparison tools.
         """
-        gpt_dict_key = str(((university_name, attribute_name), GPTMethodType.ATTRIBUTE_INFO))
+        gpt_dict_key = (university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)
         if gpt_dict_key in self.gpt_cache_dict:
             university_json[attribute_name] = self.gpt_cache_dict[gpt_dict_key][0]
             return university_json
@@ -340,6 +393,58 @@ class UniversityInfoGenerator:
         university_json[attribute_name] = generated_attr
         return university_json
 
+    def process_attributes_with_gpt(
+        self, university_json: Dict[str, str], university_name: str, attribute_names: List[str], reference: str
+    ):
+        """
+        Processes several university attributes with a single batched GPT call, caches the results, and updates the
+        university JSON.
+
+        This is the batched counterpart of `process_attribute_with_gpt`: attributes already in the GPT cache are taken
+        from it, and every remaining attribute is requested from the GPT model in one completion rather than one
+        completion per attribute. Attributes the model leaves out or answers with an empty output are not cached, so
+        the caller can still fall back to `process_attribute_with_gpt` for them.
+
+        Args:
+            university_json (Dict[str, str]): The dictionary containing data about the university.
+            university_name (str): The name of the university for which the attributes are being processed.
+            attribute_names (List[str]): The names of the attributes to process.
+            reference (str): Additional reference text to be used in the GPT query for context.
+
+        Returns:
+            Dict[str, str]: The updated university JSON dictionary with the newly processed attribute data.
+        """
+        fields = {}
+        additional_references = []
+        for attribute_name in attribute_names:
+            gpt_dict_key = (university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)
+            if gpt_dict_key in self.gpt_cache_dict:
+                university_json[attribute_name] = self.gpt_cache_dict[gpt_dict_key][0]
+                continue
+            format_, extra_prompt, additional_reference, example = self.unpack_attribute_dict(attribute_name)
+            fields[attribute_name] = {
+                "format": format_,
+                "example": f"{university_name} {attribute_name} {example}",
+                "extra_prompt": extra_prompt,
+            }
+            if additional_reference:
+                additional_references.append(additional_reference)
+        generated = self.gpt_client.get_fields_from_gpt(
+            university_name=university_name,
+            fields=fields,
+            reference=" ".join([reference, *additional_references]),
+        )
+        for attribute_name, (generated_attr, generated_reference) in generated.items():
+            if not generated_attr:
+                continue
+            # clean generated_attr if gpt find none, or it is making things up
+            if isinstance(generated_attr, str):
+                generated_attr = self.cleanup_rrm_generated_result(generated_attr)
+            gpt_dict_key = (university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)
+            self.gpt_cache_dict.update({gpt_dict_key: (generated_attr, generated_reference)})
+            university_json[attribute_name] = generated_attr
+        return university_json
+
     def cleanup_rrm_generated_result(self, result: str):
         """
         Cleans up the result string from an external retrieval or LLMs by checking for unwanted tokens
@@ -382,10 +487,7 @@ class UniversityInfoGenerator:
         This method integrates external API calls to LangChain Tavily and handles dynamic attribute processing, ensuring
         that each type of attribute is treated according to its specific retrieval needs.
         """
-        # from pprint import pprint
-        # self.attribute_dict[attribute_name]
         format_, extra_prompt, additional_reference, example = self.unpack_attribute_dict(attribute_name)
-        # pprint(f"{format_}\n {additional_reference}\n {example}\n {extra_prompt}")
         if "ranking" in attribute_name:
             generated_attr = LanchainWrapper.get_retrieved_ranking_with_format_tavily(
                 university_name=university_name,
@@ -408,6 +510,21 @@ class UniversityInfoGenerator:
         return university_json
 
     # @lru_cache(maxsize=config.CACHE_MAX_SIZE)
+    def _get_stored_university(self, university_name: str) -> Union[University, None]:
+        """
+        Returns the University stored in the university information dictionary under `university_name`, if any.
+
+        Entries loaded with `load_from_file` are plain dictionaries, as `store_cache` writes each University with
+        `to_dict_en`; such an entry is converted to a University and stored back in its place.
+        """
+        with self._cache_lock:
+            cached = self.university_info_dict.get(university_name)
+            if cached is None or isinstance(cached, University):
+                return cached
+            university = University.from_dict(cached, language="EN")
+            self.university_info_dict[university_name] = university
+            return university
+
     def get_university_info(self, university_name: str) -> University:
         """
         Gathers comprehensive information about a university by using various handlers and updates it
@@ -425,56 +542,106 @@ class UniversityInfoGenerator:
             University: An instance of the University class populated with all the relevant data about the university.
 
         Steps:
+            0. Return the University already stored in the university information dictionary, if any, looked up
+                by both the given name and the resolved official name.
             1. Initialize the base JSON structure for university information.
             2. Add basic university information from predefined sources or caches.
-            3. Iterate through each attribute specified in the system's attribute dictionary.
+            3. Submit each attribute specified in the system's attribute dictionary to the shared thread pool.
             4. Handle each attribute based on its designated handler (e.g., tuition information via crawlers,
                 other attributes via LangChain or GPT models).
-            5. For attributes without explicit data, use a GPT model to generate the required information.
+            5. For attributes without explicit data, use a single batched GPT call to generate the required
+                information, falling back to one GPT call per attribute for anything it leaves empty.
             6. Convert the final JSON data into a University instance and update the
                 central university information dictionary.
 
         This method ensures that the University instance it returns is filled with up-to-date and comprehensive
             information.
         """
+        if (cached := self._get_stored_university(university_name)) is not None:
+            return cached
         university_json = self.initialize_university_json(university_name)
         university_json, reference = self.add_basic_university_info(university_json, university_name)
-        university_name = temp if university_name != (temp := university_json["university_name"]) else university_name
-
-        # TODO: threading
-        for attribute_name in self.attribute_dict:
-            if (
-                attribute_name in ("wikipedia", "website")
-                and attribute_name in university_json
-                and len(university_json[attribute_name]) > 0
-            ):
-                continue
-            if self.attribute_dict[attribute_name]["handler"] == HandlerType.TUITION_CRAWL:
+        if resolved_name := university_json.get(_UNI_NAME):
+            university_name = resolved_name
+        if (cached := self._get_stored_university(university_name)) is not None:
+            return cached
+
+        lock = threading.Lock()
+
+        def is_filled(attribute_name: str) -> bool:
+            return attribute_name in university_json and _has_value(university_json[attribute_name])
+
+        def process_attribute(attribute_name: str, handler: HandlerType, university_json: Dict[str, str]):
+            # IO runs outside the lock on scratch dicts; only the shared university_json access is serialized
+            with lock:
+                if attribute_name in _SKIP_ATTRS and is_filled(attribute_name):
+                    return
+            # a warm GPT cache answers the attribute without running any handler
+            gpt_dict_key = (university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)
+            if (cached := self.gpt_cache_dict.get(gpt_dict_key)) is not None:
+                with lock:
+                    university_json[attribute_name] = cached[0]
+                return
+            if handler == _H_TUITION:
                 # if attribute_name in ("domestic_student_tuition", "international_student_tuition")
-                university_json = self.handle_tuition_info(university_json, university_name)
-                if attribute_name in university_json and len(university_json[attribute_name]) > 0:
-                    continue
-            if self.attribute_dict[attribute_name]["handler"] == HandlerType.LANGCHAIN_TAVILY:
-                university_json = self.process_attribute_with_langchain_tavily(
-                    university_json, university_name, attribute_name, reference
-                )
+                result = self.handle_tuition_info({}, university_name).get(attribute_name, "")
+                with lock:
+                    if _has_value(result):
+                        university_json[attribute_name] = result
+                    if is_filled(attribute_name):
+                        return
+            if handler == _H_LANGCHAIN:
+                result = self.process_attribute_with_langchain_tavily({}, university_name, attribute_name, reference)[
+                    attribute_name
+                ]
                 # TODO: cleanup if LLM is making things up
-                if attribute_name in university_json and len(university_json[attribute_name]) > 0:
-                    continue
-            # last choice
-            if attribute_name not in university_json or len(university_json[attribute_name]) <= 0:
-                # if self.attribute_dict[attribute_name]["handler"] == HandlerType.GPT_GENERAL
-                university_json = self.process_attribute_with_gpt(
-                    university_json, university_name, attribute_name, reference
-                )
-
-        generated_university: University = University.json_to_university(json.dumps(university_json), language="EN")
-        self.university_info_dict.update({university_name: generated_university})
+                with lock:
+                    if _has_value(result):
+                        university_json[attribute_name] = result
+                    if is_filled(attribute_name):
+                        return
+
+        def process_attribute_with_gpt(attribute_name: str):
+            result = self.process_attribute_with_gpt({}, university_name, attribute_name, reference)[attribute_name]
+            with lock:
+                if not is_filled(attribute_name):
+                    university_json[attribute_name] = result
+
+        futures = [
+            self._executor.submit(process_attribute, attribute_name, entry[_HANDLER_COL], university_json)
+            for attribute_name, entry in self.attribute_dict.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+        # last choice: ask GPT for every attribute still missing in one batched completion
+        # if handler == HandlerType.GPT_GENERAL
+        pending = [attribute_name for attribute_name in self.attribute_dict if not is_filled(attribute_name)]
+        self.process_attributes_with_gpt(university_json, university_name, pending, reference)
+        # fall back to one GPT call per attribute for whatever the batched completion left empty
+        futures = [
+            self._executor.submit(process_attribute_with_gpt, attribute_name)
+            for attribute_name in pending
+            if (university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO) not in self.gpt_cache_dict
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+        generated_university: University = University.from_dict(university_json, language="EN")
+        with self._cache_lock:
+            self.university_info_dict.update({university_name: generated_university})
         return generated_university
 
+    def close(self):
+        """
+        Shuts down the thread pool used by `get_university_info`, waiting for any pending attribute tasks to finish.
+        """
+        self._executor.shutdown(wait=True)
+
     def save_to_file(self, dict_type: SavedDictType, file_path: str):
         """
         Saves the dictionary specified by dict_type to a JSON file at file_path.
+        A file_path ending with `.pkl` is saved in the binary pickle format instead, which loads much faster.
 
         Parameters:
             dict_type (SavedDictType): The type of dictionary to save.
@@ -485,14 +652,19 @@ class UniversityInfoGenerator:
         """
         target_dict = self.get_specific_dict_from_type(dict_type=dict_type)
         try:
-            store_cache(file_path, target_dict)
+            if file_path.endswith(BINARY_CACHE_SUFFIX):
+                store_cache_binary(file_path, target_dict)
+            elif dict_type == SavedDictType.GPT_CACHE:
+                store_gpt_cache(file_path, target_dict)
+            else:
+                store_cache(file_path, target_dict)
         except IOError as exc:
             raise IOError(f"An error occurred while writing to the file: {file_path}") from exc
 
     def load_from_file(self, dict_type: SavedDictType, file_path: str):
         """
         Loads data from a JSON file and updates the corresponding dictionary
-        in the class based on the specified type.
+        in the class based on the specified type. A file_path ending with `.pkl` is read as a binary pickle cache.
 
         Parameters:
             dict_type (SavedDictType): The type of dictionary to update.
@@ -503,14 +675,18 @@ class UniversityInfoGenerator:
         """
         if dict_type not in SavedDictType:
             raise ValueError(f"Invalid type provided: {dict_type}. Expected a SavedDictType.")
+        if file_path.endswith(BINARY_CACHE_SUFFIX):
+            loader = load_cache_binary
+        elif dict_type == SavedDictType.GPT_CACHE:
+            loader = load_gpt_cache
+        else:
+            loader = load_cache
         try:
-            data = load_cache(file_path)
-            if not isinstance(data, dict):
-                raise ValueError("The file content must be a JSON object.")
-        except FileNotFoundError as exc:
-            raise FileNotFoundError(f"The file at {file_path} was not found.") from exc
+            data = loader(file_path)
         except json.JSONDecodeError as exc:
             raise ValueError("Failed to decode JSON. Check file content for errors.") from exc
+        if not isinstance(data, dict):
+            raise ValueError("The file content must be a JSON object.")
 
         # Using the existing method to load data into the class
         self.load_from_dict(dict_type, data)
@@ -533,19 +709,63 @@ class UniversityInfoGenerator:
 
         Side effects:
             Modifies the internal state of dictionaries managed by the class by updating them with new data.
-            Specifically for ATTRIBUTE type, it checks and modifies handler types based on their existence or value.
+            Specifically for ATTRIBUTE type, it checks and modifies handler types based on their existence or value,
+            and replaces missing (NaN) cells with empty strings.
+            For GPT_CACHE type, string keys written by older versions are converted back to tuple keys.
         """
         if dict_type not in SavedDictType:
             raise ValueError(f"Invalid type provided: {dict_type}. Expected a SavedDictType.")
         if not isinstance(input_dict, dict):
             raise ValueError("input_dict must be a dictionary.")
+        if dict_type == SavedDictType.GPT_CACHE:
+            input_dict = {
+                (gpt_cache_key_from_str(key) if isinstance(key, str) else key): value
+                for key, value in input_dict.items()
+            }
         self.get_specific_dict_from_type(dict_type).update(input_dict)
-        if dict_type == SavedDictType.ATTRIBUTE:
-            for attr in self.attribute_dict:
-                if _is_nan(self.attribute_dict[attr]["handler"]):
-                    self.attribute_dict[attr]["handler"] = HandlerType.NOT_SPECIFIED
-                    continue
-                self.attribute_dict[attr]["handler"] = HandlerType[self.attribute_dict[attr]["handler"]]
+        if dict_type == SavedDictType.ATTRIBUTE and self.attribute_dict:
+            # resolve handlers and blank out NaN cells column-wise instead of cell by cell
+            attribute_df = pd.DataFrame.from_dict(self.attribute_dict, orient="index")
+            attribute_df[_HANDLER_COL] = attribute_df[_HANDLER_COL].map(
+                lambda handler: (
+                    handler
+                    if isinstance(handler, HandlerType)
+                    else (
+                        HandlerType.NOT_SPECIFIED
+                        if pd.isna(handler)
+                        else HandlerType[handler] if isinstance(handler, str)
+                        # caches written while handlers were stored by value hold the number instead of the name
+                        else HandlerType(int(handler))
+                    )
+                )
+            )
+            attribute_df = attribute_df.astype(object).fillna("")
+            self.attribute_dict.update(attribute_df.to_dict(orient="index"))
+
+    def get_cached_attribute(self, university_name: str, attribute_name: str):
+        """
+        Looks up an attribute of a university from what has already been generated, without building the university.
+
+        The university information dictionary is checked first, then the GPT cache. This lets callers that only need
+        a single attribute avoid `get_university_info`, which fetches every attribute of the university.
+
+        Args:
+            university_name (str): The name of the university.
+            attribute_name (str): The name of the attribute to look up.
+
+        Returns:
+            The cached attribute value, or None if it has not been generated yet.
+        """
+        university = self._get_stored_university(university_name)
+        if (
+            university is not None
+            and attribute_name in University.valid_keys
+            and (value := university.get_attr(attribute_name))
+        ):
+            return value
+        if cached := self.gpt_cache_dict.get((university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)):
+            return cached[0] or None
+        return None
 
     # @lru_cache(maxsize=config.CACHE_MAX_SIZE)
     def get_university_faculty(self, university_name: str) -> List[str]:
@@ -567,6 +787,8 @@ class UniversityInfoGenerator:
             KeyError: If the 'faculty' key does not exist in the dictionary when the university
             data is a Dict type. This could indicate a discrepancy in the expected data structure.
         """
+        if cached := self.get_cached_attribute(university_name, "faculty"):
+            return cached
         university: Union[University, Dict[str, str]] = self.get_university_info(university_name)
         if isinstance(university, Dict):
             return university["faculty"]
@@ -594,6 +816,8 @@ class UniversityInfoGenerator:
             KeyError: If the 'popular_programs' key does not exist in the dictionary when the university
             data is a Dict type. This could indicate a discrepancy in the expected data structure.
         """
+        if cached := self.get_cached_attribute(university_name, "popular_programs"):
+            return cached
         university: Union[University, Dict[str, str]] = self.get_university_info(university_name)
         # print(university)
         if isinstance(university, Dict):
@@ -613,21 +837,11 @@ class UniversityInfoGenerator:
                 university_info_generator.utility.google_sheet_utility.write_cache_to_worksheet
             instead.
         """
-        # Get data in a column format
         data = self.get_university_info(university_name)
-        # Convert column data to row data
-        row_data = [list(data.to_dict_en())]
-
-        # Get the number of existing rows to determine where to start appending
-        existing_rows = len(worksheet.get_all_values())
-        # Append each "row" from row_data to the end of the worksheet
-        for i, values in enumerate(zip(*row_data), start=existing_rows + 1):
-            cell_range = worksheet.range(i, 1, i, len(values))  # Adjust range for the correct number of columns
-            for cell, value in zip(cell_range, values):
-                cell.value = value
-            worksheet.update_cells(cell_range)
-
-        print(f"Data for {university_name} appended to columns successfully.")
+        # Append the university as a single row in one request; append_rows finds the first empty row itself
+        worksheet.append_rows([[str(value) for value in data.to_dict_en().values()]], value_input_option="RAW")
+
+        print(f"Data for {university_name} appended successfully.")
 
 
 __all__ = ["UniversityInfoGenerator"]
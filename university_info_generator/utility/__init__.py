@@ -12,12 +12,19 @@ from .google_sheet_utility import (
     get_worksheet,
     get_worksheet_records,
     get_attribute_df,
-    get_attribute_dict
+    get_attribute_dict,
+    append_rows_in_chunks,
+    clear_header_cache,
 )
 
 from .save_load_utility import (
     load_cache,
     store_cache,
+    load_gpt_cache,
+    store_gpt_cache,
+    load_cache_binary,
+    store_cache_binary,
+    gpt_cache_key_from_str,
 )
 
 __all__ = [
@@ -30,6 +37,13 @@ __all__ = [
     "get_worksheet_records",
     "get_attribute_df",
     "get_attribute_dict",
+    "append_rows_in_chunks",
+    "clear_header_cache",
     "load_cache",
     "store_cache",
+    "load_gpt_cache",
+    "store_gpt_cache",
+    "load_cache_binary",
+    "store_cache_binary",
+    "gpt_cache_key_from_str",
 ]
@@ -25,9 +25,9 @@ Exceptions:
 
 Dependencies:
     gspread: For interacting with Google Sheets.
-    pandas and gspread_dataframe: For data manipulation and integration between DataFrames and Google Sheets.
-    oauth2client: For Google API authentication.
-    json: For parsing and handling JSON data structures.
+    pandas: For data manipulation and integration between DataFrames and Google Sheets.
+    google-auth: For Google API authentication.
+    orjson: For parsing and handling JSON data structures.
 
 Typical usage example:
     client = gspread.authorize(credentials)
@@ -36,33 +36,110 @@ Typical usage example:
     write_cache_to_worksheet('path/to/cache.json', worksheet)
 """
 
+from functools import lru_cache, wraps
 from typing import Dict, List
-import json
-from oauth2client.service_account import ServiceAccountCredentials
+import copy
+import inspect
+import math
+import sys
+import time
 import gspread
-from gspread_dataframe import get_as_dataframe
+import orjson
 import pandas as pd
+from pandas.io.parsers import TextParser
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from tenacity import retry, wait_random_exponential, retry_if_exception, stop_after_attempt
 from university_info_generator.configs import config
 from .save_load_utility import load_cache
 
+# rows sent per append request, keeps each request well under the Sheets API payload limit
+_APPEND_CHUNK_ROWS = 5000
+# (spreadsheet id, worksheet id) -> header row, see _cached_headers
+_HEADER_CACHE: Dict[tuple, List[str]] = {}
 
+
+def _ttl_cache(ttl: float):
+    """
+    Caches the results of a sheet read for `ttl` seconds, keyed by its bound arguments with defaults applied.
+
+    Every call returns a copy of the cached result, so callers cannot alter it for the next ones.
+    The cache can be emptied with the `cache_clear` attribute of the decorated function.
+
+    Args:
+        ttl (float): Seconds a result is reused before the sheet is read again.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.values())
+            entry = cache.get(key)
+            if entry is None or time.monotonic() - entry[0] >= ttl:
+                entry = (time.monotonic(), func(*args, **kwargs))
+                cache[key] = entry
+            return copy.copy(entry[1])
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=config.CACHE_MAX_SIZE)
 def get_sheet_client(file_path: str = config.CREDENTIAL_JSON_PATH):
     """
     Initializes and returns a gspread client authorized with the specified service account credentials.
+    The client is created once per credential file and reused by later calls, over a pooled HTTP session.
 
     Returns:
         gspread.Client: An authorized gspread client instance.
     """
+    # only needed to authorize, so importing it is deferred until a client is first created
+    from google.oauth2.service_account import Credentials
+
     scope = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
 
-    # local contains uforseAdminKey.json
-    creds = ServiceAccountCredentials.from_json_keyfile_name(file_path, scope)
-    return gspread.authorize(creds)
+    # local contains uforseAdminKey.json, the signed token is cached by the credentials and refreshed on expiry
+    creds = Credentials.from_service_account_file(file_path, scopes=scope)
+    client = gspread.authorize(creds)
+    # keep-alive connections for every helper sharing the client, transient read failures are retried with backoff
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        # the last response is handed back once retries run out, so gspread still raises its own APIError
+        max_retries=Retry(
+            total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False
+        ),
+    )
+    # gspread 6 keeps its requests session on the http client rather than on the client itself
+    client.http_client.session.mount("https://", adapter)
+    return client
+
+
+@lru_cache(maxsize=config.CACHE_MAX_SIZE)
+def _open_spreadsheet(sheet_client: gspread.Client, spreadsheet_title: str) -> gspread.Spreadsheet:
+    """
+    Opens a spreadsheet by title, looking it up on Google Drive only the first time for each client and title.
+
+    Args:
+        sheet_client (gspread.Client): The gspread client instance.
+        spreadsheet_title (str): The title of the spreadsheet.
+
+    Returns:
+        gspread.Spreadsheet: The opened spreadsheet object.
+    """
+    return sheet_client.open(spreadsheet_title)
 
 
 # Function to check and recreate the sheet if it exists
 def recreate_sheet(
-    sheet_client: gspread.Client = get_sheet_client(),
+    sheet_client: gspread.Client = None,
     title: str = "output",
     spreadsheet_title: str = "working_extract_info_output",
 ):
@@ -78,7 +155,9 @@ def recreate_sheet(
     Returns:
         gspread.Worksheet: The newly created worksheet object.
     """
-    sheet = sheet_client.open(spreadsheet_title)
+    if sheet_client is None:
+        sheet_client = get_sheet_client()
+    sheet = _open_spreadsheet(sheet_client, spreadsheet_title)
     # Check if "title" sheet exists and delete it
     worksheet_list = sheet.worksheets()
     for worksheet in worksheet_list:
@@ -86,9 +165,10 @@ def recreate_sheet(
             sheet.del_worksheet(worksheet)
             print(f"Worksheet '{title}' found and deleted.")
             break
-    sheet.add_worksheet(title=title, rows="100", cols="20")
+    # add_worksheet already returns the new worksheet, no need to look it up again
+    new_worksheet = sheet.add_worksheet(title=title, rows=100, cols=20)
     print(f"New '{title}' worksheet created.")
-    return sheet.worksheet(title)
+    return new_worksheet
 
 
 def insert_new_rows(
@@ -110,22 +190,25 @@ def insert_new_rows(
         None
     """
     new_sheet = recreate_sheet(sheet_client, cache_column_name, spreadsheet_title)
-    headers = cache[cache_column_name][0].keys()
-    rows = [list(item.values()) for item in cache[cache_column_name]]  # Convert dict values to list
-    # Insert headers and rows into the new worksheet
-    new_sheet.append_row(list(headers))  # Insert headers
-    for row in rows:
-        new_sheet.append_row(row)  # Insert each row
+    records = cache[cache_column_name]
+    headers = list(records[0])
+    rows = [headers]  # Insert headers
+    # Pick the values in header order, so records with keys in another order still land in the right columns
+    rows.extend([item.get(header) for header in headers] for item in records)
+    # Insert headers and rows into the new worksheet with as few requests as possible
+    append_rows_in_chunks(new_sheet, rows)
     print(f"Data added to '{cache_column_name}' worksheet successfully.")
 
 
+@_ttl_cache(config.SHEET_CACHE_TTL)
 def get_expect_column(
-    sheet_client: gspread.Client = get_sheet_client(),
+    sheet_client: gspread.Client = None,
     spreadsheet_title: str = "working_extract_info_output",
     sheet_title: str = "example_university",
 ) -> List[str]:
     """
     Retrieves the first row (typically containing column headers) of a worksheet.
+    The row is read at most once every `config.SHEET_CACHE_TTL` seconds for the same arguments.
 
     Args:
         sheet_client (gspread.Client): The gspread client instance.
@@ -135,11 +218,14 @@ def get_expect_column(
     Returns:
         list: A list of values from the first row of the worksheet.
     """
-    return sheet_client.open(spreadsheet_title).worksheet(sheet_title).row_values(1)
+    if sheet_client is None:
+        sheet_client = get_sheet_client()
+    return _open_spreadsheet(sheet_client, spreadsheet_title).worksheet(sheet_title).row_values(1)
 
 
+@_ttl_cache(config.SHEET_CACHE_TTL)
 def get_attribute_df(
-    sheet_client: gspread.Client = get_sheet_client(),
+    sheet_client: gspread.Client = None,
     spreadsheet_title: str = "working_extract_info_output",
     sheet_title: str = "university_attribute_format",
 ) -> pd.DataFrame:
@@ -149,10 +235,12 @@ def get_attribute_df(
     This function accesses a Google Sheet specified by the `spreadsheet_title` and `sheet_title`, reads the data,
     cleans up any rows that are entirely NaN (i.e., completely empty), and then converts the data into a dictionary
     where each attribute name becomes a key pointing to another dictionary of that attribute's details.
+    The sheet is read at most once every `config.SHEET_CACHE_TTL` seconds for the same arguments. Cells are
+    parsed like `pandas.read_csv` does, so numeric and boolean columns keep their types.
 
     Parameters:
         sheet_client (gspread.Client): A gspread Client object used to interact with Google Sheets.
-            Default: obtained from `get_sheet_client()`.
+            Default: obtained from `get_sheet_client()` at call time.
         spreadsheet_title (str): The title of the spreadsheet from which data is to be read.
             Default: "working_extract_info_output".
         sheet_title (str): The title of the specific worksheet within the spreadsheet from which data is to be read.
@@ -165,7 +253,7 @@ def get_attribute_df(
 
     Raises:
         gspread.exceptions.SpreadsheetNotFound: If the spreadsheet specified does not exist.
-        gspread.exceptions.WorksheetNotFound: If the worksheet specified does not exist within the spreadsheet.
+        gspread.exceptions.APIError: If the worksheet specified does not exist within the spreadsheet.
 
     Example:
         >>> # Assuming a gspread client is already set up
@@ -174,56 +262,102 @@ def get_attribute_df(
         print(attribute_dict['university_type'])
         # Outputs the dictionary of details for the 'university_type' attribute
     """
-    attribute_sheet = get_worksheet(
-        spreadsheet_title=spreadsheet_title, sheet_client=sheet_client, sheetname=sheet_title
-    )
-    attribute_columns = get_expect_column(
-        sheet_client=sheet_client, spreadsheet_title=spreadsheet_title, sheet_title=sheet_title
-    )
-    return get_as_dataframe(attribute_sheet, evaluate_formulas=True, headers=True, usecols=attribute_columns)
+    if sheet_client is None:
+        sheet_client = get_sheet_client()
+    # header and data rows come back from a single request, with formulas evaluated
+    value_ranges = _open_spreadsheet(sheet_client, spreadsheet_title).values_batch_get(
+        ranges=[gspread.utils.absolute_range_name(sheet_title)]
+    )["valueRanges"]
+    values = value_ranges[0].get("values", [])
+    if not values:
+        return pd.DataFrame()
+    # trailing empty cells are omitted by the API, pad them back as missing values
+    width = len(values[0])
+    rows = [row[:width] + [""] * (width - len(row)) for row in values]
+    # parsed as get_as_dataframe did, so numbers and booleans are inferred and empty cells become NaN
+    return TextParser(rows, header=0).read()
 
 
 def get_attribute_dict(
-    sheet_client: gspread.Client = get_sheet_client(),
+    sheet_client: gspread.Client = None,
     spreadsheet_title: str = "working_extract_info_output",
     sheet_title: str = "university_attribute_format",
 ) -> Dict[str, Dict[str, str]]:
     """
     load result of get_attribute_df as Dict[str, Dict[str, str]]
     """
+    if sheet_client is None:
+        sheet_client = get_sheet_client()
     data_frame = get_attribute_df(sheet_client, spreadsheet_title, sheet_title)
     data_frame = data_frame.dropna(how="all")  # Clean up the DataFrame
     data_frame.set_index("attribute_name", inplace=True)
-    return data_frame.to_dict(orient="index")
-
-
-def restore_by_cache(cache_file_path, sheet_client: gspread.Client):
+    if not data_frame.index.is_unique:
+        raise ValueError("DataFrame index must be unique for orient='index'.")
+    # same result as to_dict(orient="index"), zipping plain lists instead of going through pandas per cell
+    # repeated strings such as formats and reference urls are interned so equal cells share one object
+    columns = [sys.intern(column) if isinstance(column, str) else column for column in data_frame.columns.tolist()]
+    return {
+        attribute_name: dict(zip(columns, [sys.intern(value) if type(value) is str else value for value in row]))
+        for attribute_name, row in zip(data_frame.index.tolist(), data_frame.to_numpy().tolist())
+    }
+
+
+def restore_by_cache(
+    cache_file_path, sheet_client: gspread.Client, spreadsheet_title: str = "working_extract_info_output"
+):
     """
     Restores worksheet data from a cache file. For each key in the cache, a worksheet is recreated and
     populated with the cached data.
 
+    All worksheets are recreated with a single batch update request and filled with a single batch values update
+    request, instead of several requests per key.
+
     Args:
         cache_file_path (str): The path to the cache JSON file.
         sheet_client (gspread.Client): The gspread client instance.
+        spreadsheet_title (str): The title of the spreadsheet where the worksheets will be recreated.
 
     Returns:
         None
     """
     try:
-        with open(cache_file_path, "r", encoding="utf-8") as cache_file:
-            cache = json.load(cache_file)
+        with open(cache_file_path, "rb") as cache_file:
+            cache = orjson.loads(cache_file.read())
         print("Cache loaded successfully.")
-        for key in cache:
-            insert_new_rows(sheet_client, key, cache)
     except FileNotFoundError:
         print("Cache file not found. Starting with an empty cache.")
-        cache = {}
+        return
+    if not cache:
+        return
+
+    sheet = _open_spreadsheet(sheet_client, spreadsheet_title)
+    existing_ids = {worksheet.title: worksheet.id for worksheet in sheet.worksheets()}
+    sheet_requests = []
+    value_ranges = []
+    for key, records in cache.items():
+        # same as recreate_sheet: delete the worksheet if it exists, then add it back
+        if key in existing_ids:
+            sheet_requests.append({"deleteSheet": {"sheetId": existing_ids[key]}})
+        headers = list(records[0]) if records else []
+        # size the grid to fit the header and every record up front
+        grid_properties = {"rowCount": max(len(records) + 1, 100), "columnCount": max(len(headers), 20)}
+        sheet_requests.append({"addSheet": {"properties": {"title": key, "gridProperties": grid_properties}}})
+        if records:
+            rows = [headers]  # Insert headers
+            rows.extend([item.get(header) for header in headers] for item in records)  # Values in header order
+            value_ranges.append({"range": gspread.utils.absolute_range_name(key, "A1"), "values": rows})
+
+    sheet.batch_update({"requests": sheet_requests})
+    print(f"Worksheets {list(cache)} recreated.")
+    if value_ranges:
+        sheet.values_batch_update({"valueInputOption": "RAW", "data": value_ranges})
+    print("Data added to the worksheets successfully.")
 
 
 def get_worksheet(
     spreadsheet_title: str = "working_extract_info_output",
     sheetname: str = "output",
-    sheet_client: gspread.Client = get_sheet_client(),
+    sheet_client: gspread.Client = None,
 ) -> gspread.worksheet:
     """
     Retrieves a specific worksheet by name from the default spreadsheet.
@@ -235,10 +369,12 @@ def get_worksheet(
     Returns:
         gspread.Worksheet: The retrieved worksheet object.
     """
-    return sheet_client.open(spreadsheet_title).worksheet(sheetname)
+    if sheet_client is None:
+        sheet_client = get_sheet_client()
+    return _open_spreadsheet(sheet_client, spreadsheet_title).worksheet(sheetname)
 
 
-def get_worksheet_records(sheet_title: str, sheet_client: gspread.Client = get_sheet_client()):
+def get_worksheet_records(sheet_title: str, sheet_client: gspread.Client = None):
     """
     Fetches all records from the specified worksheet and returns them as a list of dictionaries.
 
@@ -248,10 +384,23 @@ def get_worksheet_records(sheet_title: str, sheet_client: gspread.Client = get_s
 
     Returns:
         dict: A dictionary where the key is the worksheet title and the value is a list of records.
+
+    Raises:
+        gspread.exceptions.GSpreadException: If the header row of the worksheet holds duplicate names.
     """
-    worksheet = get_worksheet(sheet_title, sheet_client)
-    # Fetch all records from the sheet to a list of dictionaries
-    records = worksheet.get_all_records()
+    if sheet_client is None:
+        sheet_client = get_sheet_client()
+    worksheet = get_worksheet(sheetname=sheet_title, sheet_client=sheet_client)
+    # Fetch all values of the sheet at once, then zip each row with the header row into a dictionary
+    values = worksheet.get_all_values()
+    if not values:
+        return {sheet_title: []}
+    headers = values[0]
+    # get_all_records refuses a header row with duplicates, as their columns would overwrite each other
+    if len(set(headers)) != len(headers):
+        raise gspread.exceptions.GSpreadException(f"the header row in the worksheet is not unique: {headers}")
+    # numbers are converted as get_all_records does
+    records = [dict(zip(headers, gspread.utils.numericise_all(row))) for row in values[1:]]
 
     # Serialize the list of dictionaries to a JSON string
     return {sheet_title: records}
@@ -262,15 +411,15 @@ def clear_worksheet_content(worksheet: gspread.worksheet):
     Clears all data in a Google Sheets worksheet, starting from the second row, preserving only the header.
 
     This function is designed to clear content from a specified worksheet without removing the header row.
-    It assesses the total number of rows and columns that contain data and clears everything from the second row
-    downwards. This is particularly useful for resetting data in a worksheet while maintaining the structure
+    It clears everything from the second row downwards across all columns of the worksheet with a single
+    batch clear request. This is particularly useful for resetting data in a worksheet while maintaining the structure
     defined by the header row.
 
     Parameters:
         worksheet (gspread.worksheet): The worksheet object from which all data except the headers will be cleared.
 
     Effects:
-        Modifies the worksheet by setting the values of all cells from the second row onwards to empty strings.
+        Modifies the worksheet by clearing the values of all cells from the second row onwards.
         This operation retains the header row (the first row) and clears any data rows below it.
 
     Raises:
@@ -287,30 +436,102 @@ def clear_worksheet_content(worksheet: gspread.worksheet):
         clear_worksheet_content(worksheet)
         print("Worksheet content has been cleared, headers remain intact.")
     """
-    # Find the number of rows and columns to clear
-    all_data = worksheet.get_all_values()
-    num_rows = len(all_data)
-    num_cols = len(all_data[0]) if num_rows > 0 else 0
+    # The grid size is known locally, so nothing has to be downloaded to size the range
+    num_rows = worksheet.row_count
+    num_cols = worksheet.col_count
 
     # Check if there's more than one row (data rows beyond the header)
     if num_rows > 1:
-        # Build the range to clear: starts from row 2 to the last row
-        cell_list = worksheet.range("A2:" + gspread.utils.rowcol_to_a1(num_rows, num_cols))
-        for cell in cell_list:
-            cell.value = ""
-        worksheet.update_cells(cell_list)
-        print(f"Cleared {num_rows - 1} rows and {num_cols} columns.")
+        # Clear from row 2 to the last row of every column with a single request
+        last_column = gspread.utils.rowcol_to_a1(1, num_cols).rstrip("1")
+        worksheet.batch_clear([f"A2:{last_column}"])
+        print(f"Cleared all rows below the header of '{worksheet.title}'.")
+
+
+def _cached_headers(worksheet: gspread.worksheet) -> List[str]:
+    """
+    Returns the header row of a worksheet, reading it from the sheet only the first time for each worksheet.
+    """
+    key = (worksheet.spreadsheet.id, worksheet.id)
+    if key not in _HEADER_CACHE:
+        _HEADER_CACHE[key] = worksheet.row_values(1)
+    return _HEADER_CACHE[key]
+
+
+def clear_header_cache(worksheet: gspread.worksheet = None):
+    """
+    Forgets the cached header row of a worksheet, or of every worksheet when none is given. Call it after
+    changing the header row of a worksheet that was written with `write_cache_to_worksheet`.
+
+    Args:
+        worksheet (gspread.worksheet, optional): The worksheet whose header row changed.
+
+    Returns:
+        None
+    """
+    if worksheet is None:
+        _HEADER_CACHE.clear()
+    else:
+        _HEADER_CACHE.pop((worksheet.spreadsheet.id, worksheet.id), None)
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """
+    Tells whether a Sheets API error is a rate limit (HTTP 429) worth retrying.
+    """
+    return isinstance(exc, gspread.exceptions.APIError) and exc.response.status_code == 429
+
+
+@retry(
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(_is_rate_limited),
+    reraise=True,
+)
+def _append_rows_chunk(worksheet: gspread.worksheet, rows: List[List[str]]):
+    """
+    Appends a chunk of rows to a worksheet, backing off and retrying when the request is rate limited.
+    """
+    worksheet.append_rows(rows, value_input_option="RAW")
+
+
+def append_rows_in_chunks(worksheet: gspread.worksheet, rows: List[list], chunk_size: int = _APPEND_CHUNK_ROWS):
+    """
+    Appends rows to a worksheet with one request per `chunk_size` rows, so large caches do not exceed the size
+    limit of a single request. Rate limited requests are retried with an exponential backoff.
+
+    The chunks are sent one after another, since concurrent appends to the same worksheet could land out of order.
+
+    Args:
+        worksheet (gspread.worksheet): The worksheet object to which the rows will be appended.
+        rows (list): The rows to append, each a list of cell values.
+        chunk_size (int): The maximum number of rows sent per request.
+
+    Returns:
+        None
+    """
+    for start in range(0, len(rows), chunk_size):
+        _append_rows_chunk(worksheet, rows[start : start + chunk_size])
+
+
+def _cell_str(value) -> str:
+    """
+    Converts a cached value to the string written to a worksheet cell, with None and NaN as an empty string.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value)
 
 
 def write_cache_to_worksheet(filepath: str, worksheet: gspread.worksheet):
     """
     Writes cache data from a JSON file to a Google Sheets worksheet, ensuring data consistency with existing columns.
 
-    This function reads cache data from a specified JSON file, processes it into a pandas DataFrame, and appends
-    each row of the DataFrame to a provided Google Sheets worksheet. It ensures that the DataFrame columns
-    align with the headers in the worksheet, raising an error if there are missing columns. This function
-    handles data cleaning by replacing NaN values with empty strings and ensures that data is appended in
-    the correct column order as defined by the worksheet's header row.
+    This function reads cache data from a specified JSON file and appends one row per cached record to a provided
+    Google Sheets worksheet in as few requests as possible. It ensures that the cached records cover the headers in the
+    worksheet, raising an error if there are missing columns. This function handles data cleaning by replacing
+    missing and NaN values with empty strings and ensures that data is appended in the correct column order as
+    defined by the worksheet's header row. The records are converted directly, without building a DataFrame.
 
     Parameters:
         filepath (str): The file path to the JSON cache file. This file should contain serialized JSON objects,
@@ -320,10 +541,10 @@ def write_cache_to_worksheet(filepath: str, worksheet: gspread.worksheet):
 
     Raises:
         FileNotFoundError: Raised if the JSON cache file specified does not exist or cannot be found.
-        ValueError: Raised if the DataFrame constructed from the JSON file is missing columns that are present
+        ValueError: Raised if the records loaded from the JSON file are missing columns that are present
                     in the worksheet headers, indicating a potential data consistency issue.
         Exception: Catches and logs other generic exceptions that could occur during the execution, such as issues
-                    with reading the file, DataFrame manipulation, or appending data to Google Sheets.
+                    with reading the file, converting the records, or appending data to Google Sheets.
 
     Usage:
         This function is intended for use in scenarios where periodic updates from a JSON-based cache to a
@@ -335,35 +556,26 @@ def write_cache_to_worksheet(filepath: str, worksheet: gspread.worksheet):
         write_cache_to_worksheet('path/to/cache.json', worksheet)
     """
     try:
-        # Load the cached data into a pandas DataFrame
+        # Load the cached data
         cache_data = load_cache(filepath)
 
         # If the cached data is a dictionary of dictionaries, convert it to a list of dictionaries
         if isinstance(cache_data, dict):
             cache_data = list(cache_data.values())
 
-        # Create a DataFrame from the list of dictionaries
-        universities_df = pd.DataFrame(cache_data)
-
-        # Cleanse the DataFrame by replacing NaN with empty strings
-        universities_df.fillna("", inplace=True)
-
-        # Get the headers from the worksheet (assuming the first row is the header)
-        headers = worksheet.row_values(1)
+        # Get the headers from the worksheet (assuming the first row is the header), read once per worksheet
+        headers = _cached_headers(worksheet)
 
-        # Reorder the DataFrame columns to match the worksheet column order
-        # Only include columns that exist in the worksheet; drop any additional columns from the DataFrame
-        if set(headers).issubset(set(universities_df.columns)):
-            universities_df = universities_df[headers]
-        else:
-            missing_columns = set(headers) - set(universities_df.columns)
-            raise ValueError(f"Missing columns in DataFrame that are expected in the worksheet: {missing_columns}")
+        # A header is missing if no record has it; records may still lack it individually
+        missing_columns = set(headers).difference(*(record.keys() for record in cache_data))
+        if missing_columns:
+            raise ValueError(f"Missing columns in cache data that are expected in the worksheet: {missing_columns}")
 
-        # Iterate over DataFrame rows and append each row to the Google Sheet
-        for _, row in universities_df.iterrows():
-            # Convert all values to string, ensuring proper format for Google Sheets
-            row_values = row.astype(str).tolist()
-            worksheet.append_row(row_values)
+        # Pick the values in the worksheet column order, dropping any additional keys of the records
+        # Convert all values to string, replacing missing values by empty strings, for Google Sheets
+        rows = [[_cell_str(record.get(header)) for header in headers] for record in cache_data]
+        # Append all rows to the Google Sheet with as few requests as possible
+        append_rows_in_chunks(worksheet, rows)
 
     except FileNotFoundError:
         print("Cache file not found. Please ensure the file path is correct.")
@@ -10,16 +10,34 @@ and updating of cached university data in a structured and efficient manner.
 
 Functions:
     load_cache(cache_path: str) -> Dict[str, Dict[str, str]]:
-        Loads cache data from a JSON file located at the specified path. This function reads the file line by line,
-        attempting to deserialize each line as a JSON object and collect them into a dictionary. It handles
-        potential issues such as file not found errors or JSON decoding errors by printing relevant messages.
+        Loads cache data from a JSON file located at the specified path. This function reads the whole file and
+        deserializes its lines, one JSON object each, with a single orjson parse before collecting them into a
+        dictionary.
+        It handles potential issues such as file not found errors or JSON decoding errors by printing relevant
+        messages, falling back to a line by line parse to report the lines that cannot be decoded. A GPT cache
+        written by `store_gpt_cache` is rejected with a ValueError rather than loaded as an empty cache.
 
     store_cache(cache_path: str, cache: Dict[str, str]):
         Stores a dictionary of data into a JSON file at the given path. Each key-value pair in the dictionary
-        is serialized into a JSON string and written to the file on a new line. Special handling is included
+        is serialized with orjson and written to the file on a new line. Special handling is included
         for keys that are tuples and values that are instances of the `University` class, ensuring they are
         properly serialized.
 
+    load_gpt_cache(cache_path: str) -> Dict[tuple, Tuple[Any, List[str]]]:
+        Loads a GPT cache saved by `store_gpt_cache`, restoring its tuple keys. Caches written by `store_cache`
+        with stringified tuple keys are still accepted.
+
+    store_gpt_cache(cache_path: str, cache: Dict[tuple, Tuple[Any, List[str]]]):
+        Streams a GPT cache with tuple keys into a file with one `[key, value]` pair per line, so keys do not
+        need to be stringified on every cache lookup.
+
+    load_cache_binary(cache_path: str) -> Dict:
+        Loads a cache saved by `store_cache_binary`.
+
+    store_cache_binary(cache_path: str, cache: Dict):
+        Stores any cache dictionary, tuple keys and `University` values included, with pickle protocol 5. Loading
+        it skips JSON tokenization entirely, which matters for large caches read on every startup.
+
 This module is typically used within backend services where caching of processed or retrieved data is required
 to enhance performance and responsiveness of the university information system.
 
@@ -36,41 +54,82 @@ Note:
     larger datasets or more complex caching needs, consider integrating a dedicated caching service or database.
 """
 
-from typing import Dict
+from enum import Enum
+from typing import Any, Dict, List, Tuple
+import ast
 import json
+import pickle
+import re
+import orjson
 from university_info_generator.university import University
+from university_info_generator.configs.enum_class import GPTMethodType
+
+BINARY_CACHE_SUFFIX = ".pkl"
+# buffer of the files read or written record by record, fewer system calls than the default 8 KiB
+_IO_BUFFER_SIZE = 64 * 1024
+_GPT_METHOD_REPR = re.compile(r"<GPTMethodType\.\w+: (\d+)>")
+
+
+def _to_serializable(value):
+    """
+    Converts values that orjson cannot serialize natively, namely `University` instances.
+    """
+    if isinstance(value, University):
+        return value.to_dict_en()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
 
 def load_cache(cache_path: str) -> Dict[str, Dict[str, str]]:
     """
     Loads and returns the cache from a JSON file.
 
+    The file holds one JSON object per line. Its lines are parsed together as a single JSON array with orjson; only
+    if that fails are they parsed one by one with the json module, which also accepts the NaN written by older
+    versions, so the lines that cannot be decoded are reported and skipped. Other records that are not JSON objects
+    are reported and skipped as well.
+
     Args:
         cache_path (str): The file path to the JSON cache file.
 
     Returns:
         dict: The loaded cache data.
+
+    Raises:
+        ValueError: If the file holds the `[key, value]` records of `store_gpt_cache`, which `load_gpt_cache` reads.
     """
-    cache_data = {}
+    records = []
     try:
-        with open(cache_path, "r", encoding="utf-8") as cache_file:
-            for line_number, line in enumerate(cache_file, start=1):
+        with open(cache_path, "rb") as cache_file:
+            lines = cache_file.read().splitlines()
+        try:
+            records = orjson.loads(b"[" + b",".join(line for line in lines if line.strip()) + b"]")
+        except orjson.JSONDecodeError:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
                 try:
-                    line_data = json.loads(line.strip())
-                    cache_data.update(line_data)
+                    records.append(json.loads(line))
                 except json.JSONDecodeError:
-                    print(f"Error decoding JSON on line {line_number}: {line.strip()}")
+                    print(f"Error decoding JSON on line {line_number}: {line.strip().decode('utf-8', 'replace')}")
     except FileNotFoundError:
         print(f"No such file: {cache_path}")
     except Exception as e:
         print(f"An error occurred: {e}")
 
-    return cache_data
+    for record in records:
+        if isinstance(record, dict):
+            continue
+        if isinstance(record, list) and len(record) == 2 and isinstance(record[0], list):
+            raise ValueError(f"{cache_path} is a GPT cache written by store_gpt_cache, load it with load_gpt_cache.")
+        print(f"Skipping a record that is not a JSON object: {record!r}")
+    # one comprehension over all records instead of an update call per line, later lines still win
+    return {key: value for record in records if isinstance(record, dict) for key, value in record.items()}
 
 
 def store_cache(cache_path, cache: Dict[str, str]):
     """
-    Stores the provided cache dictionary into a JSON file at the specified path.
+    Stores the provided cache dictionary into a JSON file at the specified path, one JSON object per line.
+    Enum members inside dictionary values, such as the handler of an attribute, are written by name.
 
     Args:
         cache_path (str): The file path where the cache will be stored.
@@ -79,14 +138,132 @@ def store_cache(cache_path, cache: Dict[str, str]):
     Returns:
         None
     """
-    with open(cache_path, "w", encoding="utf-8") as cache_file:
+    lines = []
+    for key, value in cache.items():
+        if isinstance(key, tuple):
+            key = str(key)
+        if isinstance(value, dict):
+            # orjson writes enum members by value, write them by name so handlers load back with HandlerType[...]
+            value = {field: item.name if isinstance(item, Enum) else item for field, item in value.items()}
+        # Convert to JSON bytes with newline, University values are converted by _to_serializable
+        lines.append(
+            orjson.dumps(
+                {key: value}, default=_to_serializable, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        )
+    # the whole cache is written with a single call
+    with open(cache_path, "wb") as cache_file:
+        cache_file.write(b"".join(lines))
+
+
+def gpt_cache_key_from_str(key: str) -> tuple:
+    """
+    Converts a stringified GPT cache key back into its tuple form.
+
+    Older caches were keyed by `str((param, GPTMethodType.BASIC_INFO))` or
+    `str(((university_name, attribute_name), GPTMethodType.ATTRIBUTE_INFO))`; these are flattened into
+    `(param, GPTMethodType.BASIC_INFO)` and `(university_name, attribute_name, GPTMethodType.ATTRIBUTE_INFO)`.
+
+    Args:
+        key (str): The stringified cache key.
+
+    Returns:
+        tuple: The cache key as a tuple ending with its GPTMethodType.
+    """
+    head, method = ast.literal_eval(_GPT_METHOD_REPR.sub(r"\1", key))
+    if isinstance(head, tuple):
+        return (*head, GPTMethodType(method))
+    return (head, GPTMethodType(method))
+
+
+def load_gpt_cache(cache_path: str) -> Dict[tuple, Tuple[Any, List[str]]]:
+    """
+    Loads and returns a GPT cache with tuple keys, one record per line.
+
+    Lines written by `store_gpt_cache` hold a `[key, value]` pair; lines written by `store_cache` hold a
+    `{key: value}` object with a stringified tuple key, and are converted on the fly.
+
+    Args:
+        cache_path (str): The file path to the GPT cache file.
+
+    Returns:
+        dict: The loaded GPT cache, keyed by tuples ending with their GPTMethodType.
+    """
+    cache_data = {}
+    try:
+        with open(cache_path, "rb", buffering=_IO_BUFFER_SIZE) as cache_file:
+            for line_number, line in enumerate(cache_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    print(f"Error decoding JSON on line {line_number}: {line.strip()}")
+                    continue
+                if isinstance(record, dict):
+                    for key, value in record.items():
+                        cache_data[gpt_cache_key_from_str(key)] = tuple(value)
+                    continue
+                key, value = record
+                cache_data[(*key[:-1], GPTMethodType(key[-1]))] = tuple(value)
+    except FileNotFoundError:
+        print(f"No such file: {cache_path}")
+
+    return cache_data
+
+
+def store_gpt_cache(cache_path: str, cache: Dict[tuple, Tuple[Any, List[str]]]):
+    """
+    Streams the provided GPT cache into a line-delimited JSON file, one `[key, value]` pair per line.
+
+    Tuple keys are written as JSON lists, with their trailing GPTMethodType stored by value. Records are encoded
+    one at a time, so the whole cache is never held as a single serialized string.
+
+    Args:
+        cache_path (str): The file path where the GPT cache will be stored.
+        cache (dict): The GPT cache to store.
+
+    Returns:
+        None
+    """
+    with open(cache_path, "wb", buffering=_IO_BUFFER_SIZE) as cache_file:
         for key, value in cache.items():
-            if isinstance(key, tuple):
-                key = str(key)
-            if isinstance(value, University):
-                value = value.to_dict_en()
-            json_string = json.dumps({key: value}) + "\n"  # Convert to JSON string with newline
-            cache_file.write(json_string)
+            cache_file.write(orjson.dumps([list(key), value], option=orjson.OPT_APPEND_NEWLINE))
+
+
+def load_cache_binary(cache_path: str) -> Dict:
+    """
+    Loads and returns a cache from a binary pickle file.
+
+    Only load files written by `store_cache_binary` on a trusted machine, as unpickling can execute code.
+
+    Args:
+        cache_path (str): The file path to the pickle cache file.
+
+    Returns:
+        dict: The loaded cache data.
+    """
+    try:
+        with open(cache_path, "rb", buffering=_IO_BUFFER_SIZE) as cache_file:
+            return pickle.load(cache_file)
+    except FileNotFoundError:
+        print(f"No such file: {cache_path}")
+    return {}
+
+
+def store_cache_binary(cache_path: str, cache: Dict):
+    """
+    Stores the provided cache dictionary into a binary pickle file, using pickle protocol 5.
+
+    Args:
+        cache_path (str): The file path where the cache will be stored.
+        cache (dict): The cache data to store.
+
+    Returns:
+        None
+    """
+    with open(cache_path, "wb", buffering=_IO_BUFFER_SIZE) as cache_file:
+        pickle.dump(cache, cache_file, protocol=5)
 
 
 __all__ = [name for name in dir() if name[0] != "_"]